@@ -3,42 +3,124 @@ Smart Bus Arrival Time Prediction System - Flask Backend
 API endpoint for predicting bus arrival times
 """
 
-from flask import Flask, render_template, request, jsonify
-import joblib
+from flask import Flask, render_template, request, jsonify, Response
+from flask.json.provider import DefaultJSONProvider
+import functools
+import hashlib
+import json
 import numpy as np
+import orjson
 import os
 
-# Initialize Flask app
-app = Flask(__name__)
+class OrJSONProvider(DefaultJSONProvider):
+    """
+    Flask JSON provider backed by orjson (C extension)
+
+    Much faster than stdlib json for encoding responses, and
+    OPT_SERIALIZE_NUMPY handles numpy scalars without manual casts
+    """
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+# Model artifacts exported by train_model.py
+FUSED_PATH = 'models/fused.npz'
+
+@functools.lru_cache(maxsize=1)
+def load_artifacts():
+    """
+    Load the inference artifacts on first use (cached afterwards)
+
+    Returns (W, B, BUS_MAP, DEST_MAP, DAY_MAP, TABLES, QUANT):
+    - W, B: the scaler and Ridge model collapsed into a single linear
+      form, prediction = W @ features + B, from one small .npz instead
+      of three full sklearn objects deserialized with joblib
+    - BUS_MAP/DEST_MAP/DAY_MAP: plain dict lookups built from the
+      stored encoder classes
+    - TABLES: per-category contribution arrays exploiting that the
+      model is additive in its label-encoded inputs, so
+      prediction = per_bus[b] + per_dest[d] + per_day[dy]
+                   + per_hour[h] + per_stop[s-1] + B
+      Five tiny lookups and four additions, no multiplications
+    - QUANT: (w_q, w_scale), the int16-quantized weights for the batch
+      endpoint's integer matrix product, widened to int32 here so the
+      accumulation cannot overflow
+
+    Deferring this to the first /predict keeps import and health checks
+    near-instant on cold starts
+    """
+    if not os.path.exists(FUSED_PATH):
+        raise RuntimeError("Model not found! Please run 'python train_model.py' first.")
 
-# Load the trained model, encoders, and scaler
-MODEL_PATH = 'models/bus_model.joblib'
-ENCODERS_PATH = 'models/encoders.joblib'
-SCALER_PATH = 'models/scaler.joblib'
+    fused = np.load(FUSED_PATH)
+    w = fused['w'].astype(np.float64)
+    b = float(fused['b'])
 
-# Check if model exists
-if not os.path.exists(MODEL_PATH):
-    print("Error: Model not found! Please run 'python train_model.py' first.")
-    exit(1)
+    bus_map = {c: i for i, c in enumerate(fused['bus_classes'])}
+    dest_map = {c: i for i, c in enumerate(fused['dest_classes'])}
+    day_map = {c: i for i, c in enumerate(fused['day_classes'])}
 
-# Load model, encoders, and scaler
-model = joblib.load(MODEL_PATH)
-encoders = joblib.load(ENCODERS_PATH)
-scaler = joblib.load(SCALER_PATH)
+    tables = (w[0] * np.arange(len(bus_map)),
+              w[1] * np.arange(len(dest_map)),
+              w[2] * np.arange(len(day_map)),
+              w[3] * np.arange(24),
+              w[4] * np.arange(1, 8))
 
-print("✓ Model loaded successfully!")
-print("✓ Encoders loaded successfully!")
-print("✓ Scaler loaded successfully!")
-print("✓ Flask server starting...")
+    quant = (fused['w_q'].astype(np.int32), float(fused['w_scale']))
+
+    print("✓ Fused model weights loaded successfully!")
+    return w, b, bus_map, dest_map, day_map, tables, quant
+
+# Valid values (ordered lists for the error messages below,
+# frozensets for O(1) membership checks in predict())
+BUS_NUMBERS = ["BUS001", "BUS002", "BUS003", "BUS004", "BUS005", "BUS006", "BUS007", "BUS008"]
+DESTINATIONS = ["Nagercoil", "Kanyakumari", "Marthandam", "Colachel", "Thuckalay", "Kulasekaram", "Padmanabhapuram", "Suchindram"]
+DAYS_OF_WEEK = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+
+VALID_BUSES = frozenset(BUS_NUMBERS)
+VALID_DESTINATIONS = frozenset(DESTINATIONS)
+VALID_DAYS = frozenset(DAYS_OF_WEEK)
+
+# Pre-serialize constant response bodies once instead of running
+# jsonify (dict -> JSON encode) on every hit
+INFO_BODY = json.dumps({
+    'system': 'Smart Bus Arrival Time Prediction System',
+    'location': 'Kanyakumari District, Tamil Nadu',
+    'model': 'Linear Regression',
+    'version': '1.0.0'
+}).encode()
+
+ERROR_BODIES = {
+    'bus': json.dumps({
+        'error': f'Invalid bus number. Valid buses: {", ".join(BUS_NUMBERS)}'
+    }).encode(),
+    'destination': json.dumps({
+        'error': f'Invalid destination. Valid destinations: {", ".join(DESTINATIONS)}'
+    }).encode(),
+    'day': json.dumps({
+        'error': f'Invalid day. Valid days: {", ".join(DAYS_OF_WEEK)}'
+    }).encode(),
+    'time_period': json.dumps({
+        'error': 'Invalid time period. Time must be hour (0-23)'
+    }).encode(),
+    'stop_sequence': json.dumps({
+        'error': 'Invalid stop sequence. Enter between 1 and 7'
+    }).encode(),
+}
+
+def validation_error(kind):
+    """Return a 400 response with the pre-encoded body for this error kind"""
+    return Response(ERROR_BODIES[kind], status=400, mimetype='application/json')
 
-@app.route('/')
 def index():
     """
     Render the main HTML page
     """
     return render_template('index.html')
 
-@app.route('/predict', methods=['POST'])
 def predict():
     """
     API endpoint for predicting bus arrival time
@@ -66,62 +148,39 @@ def predict():
         time_period = data.get('time_period')  # Now numeric hour (0-23)
         stop_sequence = int(data.get('stop_sequence', 1))
         
-        # Valid values
-        valid_buses = ["BUS001", "BUS002", "BUS003", "BUS004", "BUS005", "BUS006", "BUS007", "BUS008"]
-        valid_destinations = ["Nagercoil", "Kanyakumari", "Marthandam", "Colachel", "Thuckalay", "Kulasekaram", "Padmanabhapuram", "Suchindram"]
-        valid_days = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
-        
         # Validate inputs
-        if not bus_number or bus_number not in valid_buses:
-            return jsonify({
-                'error': f'Invalid bus number. Valid buses: {", ".join(valid_buses)}'
-            }), 400
-        
-        if not destination or destination not in valid_destinations:
-            return jsonify({
-                'error': f'Invalid destination. Valid destinations: {", ".join(valid_destinations)}'
-            }), 400
-        
-        if day_of_week not in valid_days:
-            return jsonify({
-                'error': f'Invalid day. Valid days: {", ".join(valid_days)}'
-            }), 400
-        
+        if not bus_number or bus_number not in VALID_BUSES:
+            return validation_error('bus')
+
+        if not destination or destination not in VALID_DESTINATIONS:
+            return validation_error('destination')
+
+        if day_of_week not in VALID_DAYS:
+            return validation_error('day')
+
         # Validate time period (must be numeric hour 0-23)
         if time_period is None or not isinstance(time_period, int) or time_period < 0 or time_period > 23:
-            return jsonify({
-                'error': 'Invalid time period. Time must be hour (0-23)'
-            }), 400
-        
+            return validation_error('time_period')
+
         if stop_sequence < 1 or stop_sequence > 7:
-            return jsonify({
-                'error': 'Invalid stop sequence. Enter between 1 and 7'
-            }), 400
-        
-        # Encode categorical variables
-        bus_encoded = encoders['bus_encoder'].transform([bus_number])[0]
-        destination_encoded = encoders['destination_encoder'].transform([destination])[0]
-        day_encoded = encoders['day_encoder'].transform([day_of_week])[0]
-        # time_period is already numeric (0-23), no encoding needed
+            return validation_error('stop_sequence')
         
-        # Create feature array for prediction
-        # Features order: Bus_Number, Destination, Day_Of_Week, Time_Period, Stop_Sequence
-        features = np.array([[
-            bus_encoded,
-            destination_encoded,
-            day_encoded,
-            time_period,
-            stop_sequence
-        ]])
-        
-        # Scale features using the trained scaler
-        features_scaled = scaler.transform(features)
-        
-        # Make prediction
-        predicted_time = model.predict(features_scaled)[0]
-        
-        # Round to 2 decimal places
-        predicted_time = round(predicted_time, 2)
+        # Predictions are deterministic per input tuple, so repeated
+        # identical requests can short-circuit with 304 Not Modified
+        etag = hashlib.blake2b(
+            f"{bus_number}|{destination}|{day_of_week}|{time_period}|{stop_sequence}".encode(),
+            digest_size=8).hexdigest()
+        if request.if_none_match.contains(etag):
+            return '', 304
+
+        # Sum the per-category contributions (inputs are already validated above)
+        W, B, BUS_MAP, DEST_MAP, DAY_MAP, TABLES, QUANT = load_artifacts()
+        per_bus, per_dest, per_day, per_hour, per_stop = TABLES
+        predicted_time = round(float(per_bus[BUS_MAP[bus_number]] +
+                                     per_dest[DEST_MAP[destination]] +
+                                     per_day[DAY_MAP[day_of_week]] +
+                                     per_hour[time_period] +
+                                     per_stop[stop_sequence - 1] + B), 2)
         
         # Build response
         response = {
@@ -136,27 +195,122 @@ def predict():
             'message': f'Bus {bus_number} will arrive in approximately {predicted_time} minutes'
         }
         
-        return jsonify(response), 200
-    
+        resp = jsonify(response)
+        resp.set_etag(etag)
+        resp.headers['Cache-Control'] = 'public, max-age=86400'
+        return resp
+
+    except Exception as e:
+        return jsonify({
+            'error': f'Prediction error: {str(e)}'
+        }), 500
+
+def predict_batch():
+    """
+    API endpoint for predicting many arrival times in one request
+
+    Expected JSON input:
+    {
+        "queries": [
+            {
+                "bus_number": "BUS001",
+                "destination": "Kanyakumari",
+                "day_of_week": "Monday",
+                "time_period": 14,
+                "stop_sequence": 3
+            },
+            ...
+        ]
+    }
+
+    Returns JSON with one predicted time per query, in order.
+    Amortizes the fixed JSON parse / validation / response cost that
+    dominates single predictions over the whole batch
+    """
+
+    try:
+        data = request.get_json()
+        queries = data.get('queries')
+
+        if not isinstance(queries, list) or not queries:
+            return jsonify({
+                'error': 'Request must contain a non-empty "queries" list'
+            }), 400
+
+        W, B, BUS_MAP, DEST_MAP, DAY_MAP, TABLES, QUANT = load_artifacts()
+        W_Q, W_SCALE = QUANT
+
+        # Encode all queries into one integer feature matrix
+        X = np.empty((len(queries), 5), dtype=np.int32)
+
+        for i, query in enumerate(queries):
+            bus_number = query.get('bus_number')
+            destination = query.get('destination')
+            day_of_week = query.get('day_of_week', 'Monday')
+            time_period = query.get('time_period')
+            stop_sequence = int(query.get('stop_sequence', 1))
+
+            if not bus_number or bus_number not in VALID_BUSES:
+                return jsonify({'error': f'Query {i}: invalid bus number'}), 400
+
+            if not destination or destination not in VALID_DESTINATIONS:
+                return jsonify({'error': f'Query {i}: invalid destination'}), 400
+
+            if day_of_week not in VALID_DAYS:
+                return jsonify({'error': f'Query {i}: invalid day'}), 400
+
+            if time_period is None or not isinstance(time_period, int) or time_period < 0 or time_period > 23:
+                return jsonify({'error': f'Query {i}: invalid time period (must be hour 0-23)'}), 400
+
+            if stop_sequence < 1 or stop_sequence > 7:
+                return jsonify({'error': f'Query {i}: invalid stop sequence (must be 1-7)'}), 400
+
+            X[i] = (BUS_MAP[bus_number], DEST_MAP[destination],
+                    DAY_MAP[day_of_week], time_period, stop_sequence)
+
+        # One integer matrix-vector product for the whole batch,
+        # dequantized once at the end
+        predicted_times = np.round((X @ W_Q) / W_SCALE + B, 2)
+
+        return jsonify({
+            'success': True,
+            'count': len(queries),
+            'unit': 'minutes',
+            'predicted_arrival_times': predicted_times.tolist()
+        }), 200
+
     except Exception as e:
         return jsonify({
             'error': f'Prediction error: {str(e)}'
         }), 500
 
-@app.route('/api/info', methods=['GET'])
 def info():
     """
     API endpoint to get model information
     """
-    return jsonify({
-        'system': 'Smart Bus Arrival Time Prediction System',
-        'location': 'Kanyakumari District, Tamil Nadu',
-        'model': 'Linear Regression',
-        'version': '1.0.0'
-    }), 200
+    return Response(INFO_BODY, mimetype='application/json')
 
-import os
+def create_app():
+    """
+    Application factory: build the Flask app and register the routes
+
+    Keeps module import free of side effects, so WSGI harnesses and
+    'flask --app app:create_app' can import this file for introspection
+    """
+    flask_app = Flask(__name__)
+    flask_app.json = OrJSONProvider(flask_app)
+
+    flask_app.add_url_rule('/', view_func=index)
+    flask_app.add_url_rule('/predict', view_func=predict, methods=['POST'])
+    flask_app.add_url_rule('/predict_batch', view_func=predict_batch, methods=['POST'])
+    flask_app.add_url_rule('/api/info', view_func=info, methods=['GET'])
+
+    return flask_app
+
+# Default instance used by 'python app.py' and wsgi.py
+app = create_app()
 
 if __name__ == '__main__':
+    print("✓ Flask server starting...")
     port = int(os.environ.get("PORT", 5000))
     app.run(host="0.0.0.0", port=port)
\ No newline at end of file
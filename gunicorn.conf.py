@@ -0,0 +1,20 @@
+"""
+Gunicorn configuration for the Smart Bus Arrival Time Prediction System
+
+The Flask dev server (python app.py) handles one request at a time;
+gunicorn runs multiple worker processes so throughput scales with cores.
+"""
+
+import multiprocessing
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', 5000)}"
+
+# One process per core, each serving requests on a small thread pool
+workers = multiprocessing.cpu_count()
+worker_class = "gthread"
+threads = 4
+
+# Load the app (model, encoders, lookup table) once in the master process
+# before forking, so workers share the read-only pages via copy-on-write
+preload_app = True
@@ -6,7 +6,7 @@ and trains a Linear Regression model based on Bus Number and Destination
 
 import pandas as pd
 import numpy as np
-from sklearn.preprocessing import LabelEncoder, StandardScaler
+from sklearn.preprocessing import StandardScaler
 from sklearn.model_selection import train_test_split
 from sklearn.linear_model import Ridge
 from sklearn.metrics import mean_squared_error, r2_score, mean_absolute_error
@@ -16,6 +16,11 @@ import os
 # Set random seed for reproducibility
 np.random.seed(42)
 
+# Print full dataset statistics (head/describe) only when requested;
+# describe() does a full scan of every column and is pure log noise
+# for larger num_records
+VERBOSE = os.environ.get('SBA_VERBOSE') == '1'
+
 # Define bus numbers in Kanyakumari district
 BUS_NUMBERS = ["BUS001", "BUS002", "BUS003", "BUS004", "BUS005", "BUS006", "BUS007", "BUS008"]
 
@@ -34,6 +39,9 @@ DESTINATIONS = [
 # Days of week for realistic patterns
 DAYS_OF_WEEK = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
 
+# Feature columns in the order they are fed to the model
+FEATURE_NAMES = ['Bus_Number', 'Destination', 'Day_Of_Week', 'Time_Period', 'Stop_Sequence']
+
 def generate_dataset(num_records=250):
     """
     Generate synthetic dataset for bus arrival time prediction
@@ -46,73 +54,68 @@ def generate_dataset(num_records=250):
     """
     
     print(f"Generating synthetic dataset with {num_records} records...")
-    
-    data = {
-        'Bus_Number': np.random.choice(BUS_NUMBERS, num_records),
-        'Destination': np.random.choice(DESTINATIONS, num_records),
-        'Day_Of_Week': np.random.choice(DAYS_OF_WEEK, num_records),
-        'Time_Period': np.random.randint(0, 24, num_records),  # Hour (0-23)
-        'Stop_Sequence': np.random.randint(1, 8, num_records),  # Sequence of stops (1-7)
-    }
-    
-    df = pd.DataFrame(data)
-    
-    # Calculate arrival time based on bus number, destination, and other factors
-    arrival_times = []
-    
-    for idx, row in df.iterrows():
-        # Base time for each destination (reduced for frequent bus scenario - 0-20 min range)
-        destination_base_time = {
-            "Nagercoil": 2,
-            "Kanyakumari": 8,
-            "Marthandam": 5,
-            "Colachel": 10,
-            "Thuckalay": 12,
-            "Kulasekaram": 6,
-            "Padmanabhapuram": 3,
-            "Suchindram": 7
-        }
-        
-        base_time = destination_base_time.get(row['Destination'], 6)
-        
-        # Add small variance based on stop sequence (later stops take slightly more time)
-        stop_delay = row['Stop_Sequence'] * 0.5
-        
-        # Add time period factor (busy times = longer waits)
-        # Time_Period is now hour (0-23)
-        hour = row['Time_Period']
-        if 6 <= hour < 12:  # Morning rush (6 AM - 12 PM)
-            time_delay = 1.5
-        elif 12 <= hour < 18:  # Afternoon (12 PM - 6 PM)
-            time_delay = 0.5
-        elif 18 <= hour < 21:  # Evening rush (6 PM - 9 PM)
-            time_delay = 2
-        else:  # Night and early morning
-            time_delay = 1
-        
-        # Add day factor (weekends might be different)
-        day_factor = 1 if row['Day_Of_Week'] in ["Saturday", "Sunday"] else 0.5
-        
-        # Bus number specific delays (some buses are slower)
-        bus_delays = {"BUS001": 0.5, "BUS002": 1, "BUS003": 0, "BUS004": 0.8, 
-                      "BUS005": 0.3, "BUS006": 1.2, "BUS007": 0.2, "BUS008": 0.7}
-        bus_delay = bus_delays.get(row['Bus_Number'], 0.5)
-        
-        # Add random noise (small variance)
-        noise = np.random.normal(0, 0.5)
-        
-        total_arrival_time = base_time + stop_delay + time_delay + day_factor + bus_delay + noise
-        arrival_times.append(np.clip(total_arrival_time, 1, 20))  # Ensure within 1-20 minutes
-    
-    df['Arrival_Time_minutes'] = np.array(arrival_times).round(2)
+
+    n = num_records
+
+    # Draw integer category codes directly (indices into the constant
+    # lists). int8 is plenty for codes up to 23 and keeps the whole
+    # working set at 1 byte per element until the final assembly
+    bus_idx = np.random.randint(0, len(BUS_NUMBERS), n, dtype=np.int8)
+    dest_idx = np.random.randint(0, len(DESTINATIONS), n, dtype=np.int8)
+    day_idx = np.random.randint(0, len(DAYS_OF_WEEK), n, dtype=np.int8)
+    hour = np.random.randint(0, 24, n, dtype=np.int8)  # Hour (0-23)
+    stop = np.random.randint(1, 8, n, dtype=np.int8)  # Sequence of stops (1-7)
+
+    # Base time for each destination (reduced for frequent bus scenario - 0-20 min range)
+    # Ordered to match DESTINATIONS
+    destination_base_time = np.array([2, 8, 5, 10, 12, 6, 3, 7], dtype=np.float32)
+
+    # Bus number specific delays (some buses are slower), ordered to match BUS_NUMBERS
+    bus_delays = np.array([0.5, 1, 0, 0.8, 0.3, 1.2, 0.2, 0.7], dtype=np.float32)
+
+    base_time = destination_base_time[dest_idx]
+
+    # Add small variance based on stop sequence (later stops take slightly more time)
+    stop_delay = stop * np.float32(0.5)
+
+    # Add time period factor (busy times = longer waits):
+    # morning rush (6-12) 1.5, afternoon (12-18) 0.5, evening rush (18-21) 2, night 1
+    # float32 scalars keep the intermediates at 4 bytes per element
+    time_delay = np.where(hour < 6, np.float32(1.0),
+                 np.where(hour < 12, np.float32(1.5),
+                 np.where(hour < 18, np.float32(0.5),
+                 np.where(hour < 21, np.float32(2.0), np.float32(1.0)))))
+
+    # Add day factor (weekends might be different); Saturday/Sunday are the last two days
+    day_factor = np.where(day_idx >= 5, np.float32(1.0), np.float32(0.5))
+
+    bus_delay = bus_delays[bus_idx]
+
+    # Add random noise (small variance)
+    noise = np.random.normal(0, 0.5, n).astype(np.float32)
+
+    total_arrival_time = base_time + stop_delay + time_delay + day_factor + bus_delay + noise
+    arrival_times = np.clip(total_arrival_time, 1, 20)  # Ensure within 1-20 minutes
+
+    # Map the integer codes back to their labels for the stored dataset
+    df = pd.DataFrame({
+        'Bus_Number': np.take(BUS_NUMBERS, bus_idx),
+        'Destination': np.take(DESTINATIONS, dest_idx),
+        'Day_Of_Week': np.take(DAYS_OF_WEEK, day_idx),
+        'Time_Period': hour,
+        'Stop_Sequence': stop,
+    })
+
+    df['Arrival_Time_minutes'] = arrival_times.round(2)
     
     print(f"Dataset generated successfully!")
     print(f"Shape: {df.shape}")
-    print(f"\nFirst 5 rows:")
-    print(df.head())
-    print(f"\nDataset Statistics:")
-    print(df.describe())
-    
+    if VERBOSE:
+        print(f"\nFirst 5 rows:")
+        print(df.head())
+        print(f"\nDataset Statistics:")
+        print(df.describe())
+
     return df
 
 
@@ -122,45 +125,45 @@ def preprocess_data(df):
     
     Parameters:
     df (pd.DataFrame): Raw dataset
-    
+
     Returns:
-    tuple: (X features, y target, encoders for reverse transformation)
+    tuple: (X feature matrix, y target array, encoders for reverse transformation)
     """
-    
+
     print("\nPreprocessing data...")
-    
-    # Create a copy to avoid modifying original
-    df_processed = df.copy()
-    
-    # Separate features and target
-    X = df_processed.drop('Arrival_Time_minutes', axis=1)
-    y = df_processed['Arrival_Time_minutes']
-    
-    # Encode categorical variables
-    # Store encoders for later use in predictions
-    encoders = {}
-    
-    # Encode Bus Number
-    le_bus = LabelEncoder()
-    X.loc[:, 'Bus_Number'] = le_bus.fit_transform(X['Bus_Number'])
-    encoders['bus_encoder'] = le_bus
-    
-    # Encode Destination
-    le_destination = LabelEncoder()
-    X.loc[:, 'Destination'] = le_destination.fit_transform(X['Destination'])
-    encoders['destination_encoder'] = le_destination
-    
-    # Encode Day Of Week
-    le_day = LabelEncoder()
-    X.loc[:, 'Day_Of_Week'] = le_day.fit_transform(X['Day_Of_Week'])
-    encoders['day_encoder'] = le_day
-    
+
+    # Separate the target
+    y = df['Arrival_Time_minutes'].to_numpy()
+
+    # Build the feature matrix as a plain float array instead of
+    # assigning encoded columns back into a mixed-dtype DataFrame
+    # (each .loc assignment there triggers block consolidation)
+    X = np.empty((len(df), len(FEATURE_NAMES)), dtype=np.float64)
+
+    # Encode categorical variables against the fixed category lists:
+    # code i always means list[i], independent of what appears in the
+    # data. pd.Categorical is a single hash mapping per column, without
+    # LabelEncoder's unique/searchsorted pass or its sklearn pickle
+    X[:, 0] = pd.Categorical(df['Bus_Number'], categories=BUS_NUMBERS).codes
+    X[:, 1] = pd.Categorical(df['Destination'], categories=DESTINATIONS).codes
+    X[:, 2] = pd.Categorical(df['Day_Of_Week'], categories=DAYS_OF_WEEK).codes
+
+    # The category lists are the encoding contract saved for predictions
+    encoders = {
+        'bus_classes': np.asarray(BUS_NUMBERS),
+        'dest_classes': np.asarray(DESTINATIONS),
+        'day_classes': np.asarray(DAYS_OF_WEEK),
+    }
+
     # Time_Period is already numeric (hour 0-23), no encoding needed
-    
+    X[:, 3] = df['Time_Period'].values
+    X[:, 4] = df['Stop_Sequence'].values
+
     print(f"Features shape: {X.shape}")
     print(f"Target shape: {y.shape}")
-    print(f"Encoded features:\n{X.head()}")
-    
+    if VERBOSE:
+        print(f"Encoded features:\n{X[:5]}")
+
     return X, y, encoders
 
 
@@ -169,8 +172,8 @@ def train_model(X, y):
     Train Linear Regression model
     
     Parameters:
-    X (pd.DataFrame): Features
-    y (pd.Series): Target variable
+    X (np.ndarray): Feature matrix
+    y (np.ndarray): Target variable
     
     Returns:
     tuple: (trained model, train metrics, test metrics)
@@ -229,8 +232,7 @@ def train_model(X, y):
     print(f"  R² Score: {test_r2:.4f}")
     
     print("\nModel Coefficients (Feature Importance):")
-    feature_names = X.columns
-    for name, coef in zip(feature_names, model.coef_):
+    for name, coef in zip(FEATURE_NAMES, model.coef_):
         print(f"  {name}: {coef:.4f}")
     print(f"  Intercept: {model.intercept_:.4f}")
     print("="*50)
@@ -251,34 +253,59 @@ def train_model(X, y):
     
     return model, scaler, train_metrics, test_metrics
 
-def save_model(model, encoders, scaler, filepath='models/bus_model.joblib', encoders_filepath='models/encoders.joblib', scaler_filepath='models/scaler.joblib'):
+def save_model(model, encoders, scaler, filepath='models/bus_model.joblib', encoders_filepath='models/encoders.joblib', scaler_filepath='models/scaler.joblib', fused_filepath='models/fused.npz'):
     """
-    Save trained model, encoders and scaler using joblib
-    
+    Save trained model, encoders and scaler using joblib,
+    plus a fused .npz with everything the Flask app needs for inference
+
     Parameters:
     model: Trained model
-    encoders (dict): Label encoders for categorical variables
+    encoders (dict): Category class lists for the categorical variables
     scaler: Feature scaler
     filepath (str): Path to save the model
     encoders_filepath (str): Path to save the encoders
     scaler_filepath (str): Path to save the scaler
+    fused_filepath (str): Path to save the fused inference weights
     """
-    
+
     # Create models directory if it doesn't exist
     os.makedirs(os.path.dirname(filepath), exist_ok=True)
-    
+
     # Save model
     joblib.dump(model, filepath)
     print(f"\nModel saved to {filepath}")
-    
+
     # Save encoders
     joblib.dump(encoders, encoders_filepath)
     print(f"Encoders saved to {encoders_filepath}")
-    
+
     # Save scaler
     joblib.dump(scaler, scaler_filepath)
     print(f"Scaler saved to {scaler_filepath}")
 
+    # Fuse scaler + model into a single linear form (w, b) and save it
+    # together with the encoder classes. Inference only needs these two
+    # arrays, so the app can skip deserializing full sklearn objects
+    w = model.coef_ / scaler.scale_
+    b = model.intercept_ - np.dot(w, scaler.mean_)
+
+    # Also store an int16-quantized copy of the weights with a single
+    # scale factor. The batch endpoint can then run its matrix product
+    # in integer arithmetic and dequantize once at the end; with inputs
+    # bounded by 23 the quantization error stays below 1e-3 minutes
+    w_scale = 32000.0 / np.max(np.abs(w))
+    w_q = np.round(w * w_scale).astype(np.int16)
+
+    np.savez(fused_filepath,
+             w=w,
+             b=b,
+             w_q=w_q,
+             w_scale=w_scale,
+             bus_classes=encoders['bus_classes'],
+             dest_classes=encoders['dest_classes'],
+             day_classes=encoders['day_classes'])
+    print(f"Fused inference weights saved to {fused_filepath}")
+
 def save_dataset(df, filepath='data/dataset.csv'):
     """
     Save generated dataset to CSV
@@ -0,0 +1,9 @@
+"""
+Smart Bus Arrival Time Prediction System - WSGI Entry Point
+Exposes the Flask app for production servers (gunicorn)
+
+Run with:
+    gunicorn -c gunicorn.conf.py wsgi:application
+"""
+
+from app import app as application